@@ -7,79 +7,132 @@ potential data inconsistencies in OpenStreetMap across different cities and regi
 """
 
 import requests
+import gzip
+import hashlib
+import functools
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
-import pandas as pd
-from fuzzywuzzy import fuzz
+import csv
+import numpy as np
+from rapidfuzz import fuzz, process, utils
 import re
-from typing import List, Dict, Tuple, Optional
+from typing import List, Dict, Tuple, Optional, NamedTuple, Iterable, Iterator
 import time
 import sys
+import threading
+import contextvars
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 import argparse
 import os
 from datetime import datetime
+from collections import defaultdict
 
-# Color support
+class MockColor:
+    def __getattr__(self, name):
+        return ""
+
+# Color support (only when writing to a terminal - pipes and files get plain text)
 try:
     from colorama import Fore, Back, Style, init
-    init(autoreset=True)  # Auto-reset colors after each print
-    COLORS_AVAILABLE = True
+    COLORS_AVAILABLE = sys.stdout.isatty()
+    if COLORS_AVAILABLE:
+        init(autoreset=True)  # Auto-reset colors after each print
 except ImportError:
     # Fallback if colorama is not available
-    class MockColor:
-        def __getattr__(self, name):
-            return ""
-    Fore = Back = Style = MockColor()
     COLORS_AVAILABLE = False
 
+if not COLORS_AVAILABLE:
+    Fore = Back = Style = MockColor()
+
+# colorama has no underline code, so use the ANSI sequence directly
+UNDERLINE = '\033[4m' if COLORS_AVAILABLE else ''
+
+# MinHash-LSH support for large name sets
+try:
+    from datasketch import MinHash, MinHashLSH
+    LSH_AVAILABLE = True
+except ImportError:
+    # Fallback to exact pairwise comparison if datasketch is not available
+    LSH_AVAILABLE = False
+
+# Fast JSON decoding support
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    # Fallback to the standard library json module
+    ORJSON_AVAILABLE = False
+
+# Status lines from background work are collected here (instead of printed) so they can
+# be replayed in order once the main flow reaches that step
+STATUS_BUFFER = contextvars.ContextVar('status_buffer', default=None)
+
+# Set for background work that is no longer needed, so it stops issuing Overpass queries
+CANCEL_EVENT = contextvars.ContextVar('cancel_event', default=None)
+
+def background_cancelled() -> bool:
+    """Return True if the current background work has been cancelled"""
+    event = CANCEL_EVENT.get()
+    return event is not None and event.is_set()
+
+def emit(text):
+    """Print a status line, or buffer it when running as background work"""
+    buffer = STATUS_BUFFER.get()
+    if buffer is None:
+        print(text)
+    else:
+        buffer.append(text)
+
 # Color helper functions
 def print_success(text):
     """Print success message in green"""
-    print(f"{Fore.GREEN}{Style.BRIGHT}✅ {text}{Style.RESET_ALL}")
+    emit(f"{Fore.GREEN}{Style.BRIGHT}✅ {text}{Style.RESET_ALL}")
 
 def print_info(text):
     """Print info message in blue"""
-    print(f"{Fore.BLUE}{Style.BRIGHT}🔍 {text}{Style.RESET_ALL}")
+    emit(f"{Fore.BLUE}{Style.BRIGHT}🔍 {text}{Style.RESET_ALL}")
 
 def print_warning(text):
     """Print warning message in yellow"""
-    print(f"{Fore.YELLOW}{Style.BRIGHT}⚠️  {text}{Style.RESET_ALL}")
+    emit(f"{Fore.YELLOW}{Style.BRIGHT}⚠️  {text}{Style.RESET_ALL}")
 
 def print_error(text):
     """Print error message in red"""
-    print(f"{Fore.RED}{Style.BRIGHT}❌ {text}{Style.RESET_ALL}")
+    emit(f"{Fore.RED}{Style.BRIGHT}❌ {text}{Style.RESET_ALL}")
 
 def print_detective(text):
     """Print detective message in magenta"""
-    print(f"{Fore.MAGENTA}{Style.BRIGHT}🕵️  {text}{Style.RESET_ALL}")
+    emit(f"{Fore.MAGENTA}{Style.BRIGHT}🕵️  {text}{Style.RESET_ALL}")
 
 def print_location(text):
     """Print location message in cyan"""
-    print(f"{Fore.CYAN}{Style.BRIGHT}📍 {text}{Style.RESET_ALL}")
+    emit(f"{Fore.CYAN}{Style.BRIGHT}📍 {text}{Style.RESET_ALL}")
 
 def print_file(text):
     """Print file message in green"""
-    print(f"{Fore.GREEN}{Style.BRIGHT}📁 {text}{Style.RESET_ALL}")
+    emit(f"{Fore.GREEN}{Style.BRIGHT}📁 {text}{Style.RESET_ALL}")
 
 def print_header(text):
     """Print header with background"""
-    print(f"{Back.BLUE}{Fore.WHITE}{Style.BRIGHT} {text} {Style.RESET_ALL}")
+    emit(f"{Back.BLUE}{Fore.WHITE}{Style.BRIGHT} {text} {Style.RESET_ALL}")
 
 def install_packages():
     """Install required packages if not already installed"""
     try:
         import requests
-        import pandas as pd
-        from fuzzywuzzy import fuzz
+        import numpy as np
+        from rapidfuzz import fuzz
         return True
     except ImportError:
         print_info("Installing required packages...")
         import subprocess
         try:
-            subprocess.check_call([sys.executable, "-m", "pip", "install", "requests", "pandas", "fuzzywuzzy[speedup]", "colorama"])
+            subprocess.check_call([sys.executable, "-m", "pip", "install", "requests", "numpy", "rapidfuzz", "colorama"])
             return True
         except subprocess.CalledProcessError:
             print_error("Failed to install packages. Please install manually:")
-            print("pip install requests pandas fuzzywuzzy[speedup] colorama")
+            print("pip install requests numpy rapidfuzz colorama")
             return False
 
 # City-level bounding boxes (focused, faster searches)
@@ -116,17 +169,114 @@ PLACE_TYPES = {
     "education": ["school", "university", "college", "kindergarten", "library"]
 }
 
+# OSM tag keys that determine a place's category
+CATEGORY_KEYS = frozenset(PLACE_TYPES)
+
+# Address tags joined (in this order) into a place's address
+ADDRESS_KEYS = ('addr:housenumber', 'addr:street', 'addr:district', 'addr:city')
+
+class Place(NamedTuple):
+    """A named place extracted from an OSM element"""
+    name: str
+    type: str
+    id: int
+    lat: Optional[float]
+    lon: Optional[float]
+    category: str
+    subcategory: str
+    address: Optional[str]
+    phone: Optional[str]
+    website: Optional[str]
+    opening_hours: Optional[str]
+    brand: Optional[str]
+    cuisine: Optional[str]
+
+# Place fields written to CSV/JSON reports
+EXPORT_COLUMNS = list(Place._fields)
+
 # Overpass API endpoint
 OVERPASS_URL = "http://overpass-api.de/api/interpreter"
 
+def create_overpass_session() -> requests.Session:
+    """Create an HTTP session with keep-alive connection pooling and retries"""
+    session = requests.Session()
+    session.headers.update({'Accept-Encoding': 'gzip', 'User-Agent': 'place-detective/1.0'})
+
+    # Overpass queries are read-only, so POST requests are safe to retry - but only on
+    # rate limit/gateway statuses and connection failures. A read timeout means the server
+    # is still running the query, and resending it would just start another heavy query.
+    retries = Retry(total=3, connect=3, read=0, other=0, backoff_factor=1.5,
+                    status_forcelist=[429, 502, 504], allowed_methods=frozenset({'GET', 'POST'}))
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retries)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+# Shared session so all tile queries reuse the same connection
+OVERPASS_SESSION = create_overpass_session()
+
+# Overpass allows 2 concurrent queries per IP - never exceed this, even across calls
+OVERPASS_MAX_SLOTS = 2
+OVERPASS_SLOTS = threading.Semaphore(OVERPASS_MAX_SLOTS)
+
+# Tile workers - one more than the slot limit, so a request can be in flight while
+# another worker decodes (and caches) the previous tile's response
+TILE_WORKERS = OVERPASS_MAX_SLOTS + 1
+
+# Serializes console output from concurrent tile queries
+PRINT_LOCK = threading.Lock()
+
+# On-disk Overpass response cache (updated from command line arguments)
+CACHE_SETTINGS = {
+    'enabled': True,
+    'dir': os.path.join(os.path.expanduser('~'), '.cache', 'place_detective'),
+    'ttl_hours': 24.0
+}
+
+# Adaptive tiling settings for large areas
+SINGLE_QUERY_MAX_AREA = 1.0       # Query areas up to this size (square degrees) without tiling
+TILE_MAX_ELEMENTS = 20000         # Split tiles whose probed element count exceeds this
+TILE_MIN_AREA = 0.01              # Never split tiles smaller than this (square degrees)
+
+# Name variation analysis settings
+NAME_VARIATION_THRESHOLD = 80     # Report name pairs with similarity above this
+LSH_MIN_NAMES = 100000            # Use MinHash-LSH candidate generation above this many unique names
+                                  # (below this the blocked cdist pass is faster than building MinHashes).
+                                  # LSH is approximate: recall depends on the names and was as low as
+                                  # 73% of the exact pairs on a 1500-name synthetic set, so it is only
+                                  # used where the exact pass is impractical
+LSH_NUM_PERM = 128                # Number of MinHash permutations
+LSH_JACCARD_THRESHOLD = 0.3       # Trigram Jaccard threshold for candidates (looser than the 80% ratio
+                                  # so short names with one typo still become candidates)
+
+# Fuzzy matching scorers (scorer, name form) - the best score wins. Name forms index into
+# name_forms(): 1 lowercase, 2 processed (punctuation stripped), 3 processed with sorted
+# tokens, so a plain ratio on it equals token_sort_ratio without re-sorting per comparison.
+SIMILARITY_SCORERS = (
+    (fuzz.ratio, 1),
+    (fuzz.ratio, 3),
+    (fuzz.token_set_ratio, 2),
+)
+
+# Scoring calls bound once with the shared options: names are preprocessed by the caller,
+# scores are rounded to integers (as reported) and work is spread across all cores
+score_matrix = functools.partial(process.cdist, processor=None, dtype=np.uint8, workers=-1)
+score_pairwise = functools.partial(process.cpdist, processor=None, dtype=np.uint8, workers=-1)
+
+@functools.lru_cache(maxsize=256)
+def parse_bbox(bbox_str: str) -> Tuple[float, float, float, float]:
+    """Parse a "south,west,north,east" bounding box string (cached, so each bbox is parsed once)"""
+    south, west, north, east = map(float, bbox_str.split(','))
+    return south, west, north, east
+
 def calculate_bbox_area(bbox_str: str) -> float:
     """Calculate the area of a bounding box in square degrees"""
-    south, west, north, east = map(float, bbox_str.split(','))
+    south, west, north, east = parse_bbox(bbox_str)
     return (north - south) * (east - west)
 
 def split_bbox_into_tiles(bbox_str: str, max_tiles: int = 16) -> List[str]:
     """Split a large bounding box into smaller tiles"""
-    south, west, north, east = map(float, bbox_str.split(','))
+    south, west, north, east = parse_bbox(bbox_str)
     
     # Calculate how many tiles we need in each direction
     area = (north - south) * (east - west)
@@ -159,58 +309,234 @@ def split_bbox_into_tiles(bbox_str: str, max_tiles: int = 16) -> List[str]:
     
     return tiles
 
+def split_bbox_in_quarters(bbox_str: str) -> List[str]:
+    """Split a bounding box into four equal quadrants"""
+    south, west, north, east = parse_bbox(bbox_str)
+    mid_lat = (south + north) / 2
+    mid_lon = (west + east) / 2
+    return [
+        f"{south},{west},{mid_lat},{mid_lon}",
+        f"{south},{mid_lon},{mid_lat},{east}",
+        f"{mid_lat},{west},{north},{mid_lon}",
+        f"{mid_lat},{mid_lon},{north},{east}"
+    ]
+
+def submit_with_context(executor: ThreadPoolExecutor, func, *args) -> Future:
+    """Submit work that runs in a copy of the caller's context (keeping status buffering)"""
+    return executor.submit(contextvars.copy_context().run, func, *args)
+
+def run_in_background(func, *args, **kwargs) -> Tuple[Future, List[str], threading.Event]:
+    """Start func on a daemon thread, buffering its status lines for later replay.
+    Setting the returned event cancels any Overpass queries it has not started yet."""
+    status_lines = []
+    cancel = threading.Event()
+    context = contextvars.copy_context()
+    context.run(STATUS_BUFFER.set, status_lines)
+    context.run(CANCEL_EVENT.set, cancel)
+    future = Future()
+
+    def run():
+        try:
+            future.set_result(context.run(func, *args, **kwargs))
+        except Exception as e:
+            future.set_exception(e)
+
+    # Daemon thread - once cancelled, queued probes and tiles finish without querying,
+    # so only requests already in flight can delay exit
+    threading.Thread(target=run, daemon=True).start()
+    return future, status_lines, cancel
+
+def probe_count(bbox: str, filters: Tuple[str, List[str]], timeout: int = 60) -> Optional[int]:
+    """Count the elements a query would return in a bounding box (tiny response)"""
+    query = generate_overpass_query("", bbox, timeout=timeout, prebuilt_filters=filters, output="count")
+    result = query_overpass(query)
+    try:
+        return int(result['elements'][0]['tags']['total'])
+    except (TypeError, KeyError, IndexError, ValueError):
+        return None
+
+def split_bbox_adaptively(bbox_str: str, filters: Tuple[str, List[str]], timeout: int = 60,
+                          max_count: int = TILE_MAX_ELEMENTS, min_area: float = TILE_MIN_AREA) -> List[str]:
+    """Split a bounding box as a quadtree, only subdividing tiles with too many elements"""
+    tiles = []
+    pending = [bbox_str]
+    probe = functools.partial(probe_count, filters=filters, timeout=timeout)
+
+    with ThreadPoolExecutor(max_workers=OVERPASS_MAX_SLOTS) as executor:
+        while pending:
+            print_info(f"Probing element density of {Fore.YELLOW}{len(pending)}{Style.RESET_ALL} tile(s)...")
+            futures = [submit_with_context(executor, probe, tile) for tile in pending]
+            counts = [future.result() for future in futures]
+
+            next_level = []
+            for tile, count in zip(pending, counts):
+                if count is None:
+                    # Probe failed - fall back to the fixed grid for this tile
+                    tiles.extend(split_bbox_into_tiles(tile))
+                elif count == 0:
+                    # Nothing to fetch here (e.g. open sea)
+                    continue
+                elif count > max_count and calculate_bbox_area(tile) / 4 >= min_area:
+                    next_level.extend(split_bbox_in_quarters(tile))
+                else:
+                    tiles.append(tile)
+            pending = next_level
+
+    return tiles
+
+def parse_json(data: bytes):
+    """Decode a JSON document, using orjson when available"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def overpass_runtime_error(result: Optional[dict]) -> Optional[str]:
+    """Return the remark of a result Overpass cut short (timeout, out of memory), if any"""
+    remark = (result or {}).get('remark') or ''
+    return remark if remark.startswith('runtime error') else None
+
+def dump_json(obj) -> bytes:
+    """Encode an object as compact UTF-8 JSON, using orjson when available"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode('utf-8')
+
+def cache_path_for(query: str) -> str:
+    """Return the cache file path for a query, keyed by a hash of the query text"""
+    key = hashlib.blake2b(query.encode('utf-8'), digest_size=16).hexdigest()
+    return os.path.join(CACHE_SETTINGS['dir'], f"{key}.json.gz")
+
+def read_cached_response(query: str) -> Optional[dict]:
+    """Return a fresh cached response for a query, or None if not cached"""
+    if not CACHE_SETTINGS['enabled']:
+        return None
+
+    cache_path = cache_path_for(query)
+    try:
+        age = time.time() - os.path.getmtime(cache_path)
+        if age < CACHE_SETTINGS['ttl_hours'] * 3600:
+            with gzip.open(cache_path, 'rb') as f:
+                result = parse_json(f.read())
+            with PRINT_LOCK:
+                print_info(f"Using cached Overpass response ({Fore.YELLOW}{age / 60:.0f}{Style.RESET_ALL} minutes old)")
+            return result
+    except (OSError, EOFError, json.JSONDecodeError):
+        # Missing, unreadable or corrupt cache entry - fetch fresh data
+        pass
+    return None
+
+def write_cached_response(query: str, result: dict) -> None:
+    """Store a response in the on-disk cache"""
+    if not CACHE_SETTINGS['enabled']:
+        return
+
+    # Write to a temporary file first so concurrent readers never see partial data
+    cache_path = cache_path_for(query)
+    temp_path = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        os.makedirs(CACHE_SETTINGS['dir'], exist_ok=True)
+        with gzip.open(temp_path, 'wb') as f:
+            f.write(dump_json(result))
+        os.replace(temp_path, cache_path)
+    except OSError as e:
+        with PRINT_LOCK:
+            print_warning(f"Could not write Overpass cache: {e}")
+
+def prune_expired_cache() -> None:
+    """Delete expired cache entries and stale temporary files so the cache doesn't grow without bound"""
+    if not CACHE_SETTINGS['enabled']:
+        return
+
+    cutoff = time.time() - CACHE_SETTINGS['ttl_hours'] * 3600
+    try:
+        entries = list(os.scandir(CACHE_SETTINGS['dir']))
+    except OSError:
+        # No cache directory yet - nothing to prune
+        return
+
+    for entry in entries:
+        if not entry.name.endswith(('.json.gz', '.tmp')):
+            continue
+        try:
+            if entry.stat().st_mtime < cutoff:
+                os.remove(entry.path)
+        except OSError:
+            # Entry removed concurrently or not removable - leave it
+            pass
+
+def cached_overpass_response(func):
+    """Cache Overpass responses on disk as gzipped JSON, keyed by a hash of the query"""
+    @functools.wraps(func)
+    def wrapper(query: str) -> dict:
+        result = read_cached_response(query)
+        if result is not None:
+            return result
+
+        result = func(query)
+        # Incomplete results (runtime error remark) are not cached, so a re-run can fix them
+        if result is not None and not overpass_runtime_error(result):
+            write_cached_response(query, result)
+        return result
+    return wrapper
+
+@cached_overpass_response
 def query_overpass(query: str) -> dict:
     """Execute an Overpass API query"""
     try:
-        response = requests.get(OVERPASS_URL, params={'data': query}, timeout=60)
+        with OVERPASS_SLOTS:
+            if background_cancelled():
+                return None
+            response = OVERPASS_SESSION.post(OVERPASS_URL, data={'data': query}, timeout=60)
         response.raise_for_status()
-        return response.json()
+        result = parse_json(response.content)
+        remark = overpass_runtime_error(result)
+        if remark:
+            # Overpass still answers 200, but the elements are partial or missing
+            with PRINT_LOCK:
+                print_warning(f"Overpass returned an incomplete result: {remark}")
+        return result
     except requests.exceptions.RequestException as e:
-        print_error(f"Error querying Overpass API: {e}")
+        with PRINT_LOCK:
+            print_error(f"Error querying Overpass API: {e}")
         return None
     except json.JSONDecodeError as e:
-        print_error(f"Error parsing JSON response: {e}")
+        with PRINT_LOCK:
+            print_error(f"Error parsing JSON response: {e}")
         return None
 
-def generate_broad_overpass_query(bbox: str, place_types: Optional[List[str]] = None, timeout: int = 60) -> str:
-    """Generate Overpass API query to get all named places (for fuzzy matching)"""
-    
-    # Base query parts for all named elements
-    queries = []
-    
-    # Add place type filters if specified
-    if place_types:
-        for place_type in place_types:
-            if '=' in place_type:
-                # Handle key=value format (e.g., "amenity=restaurant")
-                key, value = place_type.split('=', 1)
-                type_filter = f'["{key}"="{value}"]'
-            else:
-                # Handle key-only format (e.g., "amenity")
-                type_filter = f'["{place_type}"]'
-            
-            queries.extend([
-                f'node["name"]{type_filter}({bbox});',
-                f'way["name"]{type_filter}({bbox});',
-                f'relation["name"]{type_filter}({bbox});'
-            ])
-    else:
+def build_type_filters(place_types: Optional[List[str]] = None) -> List[str]:
+    """Build Overpass tag filters for place types (a single empty filter matches all types)"""
+    if not place_types:
         # No place type filter - search all named elements
-        queries.extend([
-            f'node["name"]({bbox});',
-            f'way["name"]({bbox});',
-            f'relation["name"]({bbox});'
-        ])
-    
-    query = f"""
-    [out:json][timeout:{timeout}];
-    (
-      {chr(10).join('  ' + q for q in queries)}
-    );
-    out center meta;
-    """
-    
-    return query
+        return ['']
+
+    type_filters = []
+    for place_type in place_types:
+        if '=' in place_type:
+            # Handle key=value format (e.g., "amenity=restaurant")
+            key, value = place_type.split('=', 1)
+            type_filters.append(f'["{key}"="{value}"]')
+        else:
+            # Handle key-only format (e.g., "amenity")
+            type_filters.append(f'["{place_type}"]')
+
+    return type_filters
+
+def build_name_pattern(search_term: str, exact_match: bool = False) -> str:
+    """Build the Overpass name filter for a search term"""
+    if exact_match:
+        return f'"name"="{search_term}"'
+
+    # Case-insensitive regex for variations. Overpass regexes are unanchored,
+    # so wrapping the term in .* only adds regex engine work.
+    return f'"name"~"{re.escape(search_term)}",i'
+
+def generate_broad_overpass_query(bbox: str, place_types: Optional[List[str]] = None, timeout: int = 60,
+                                  prebuilt_filters: Optional[Tuple[str, List[str]]] = None) -> str:
+    """Generate Overpass API query to get all named places (for fuzzy matching)"""
+    if prebuilt_filters is None:
+        prebuilt_filters = ('"name"', build_type_filters(place_types))
+    return generate_overpass_query("", bbox, place_types, timeout=timeout, prebuilt_filters=prebuilt_filters)
 
 def query_overpass_with_chunking(search_term: str, bbox: str, place_types: Optional[List[str]] = None, 
                                 exact_match: bool = False, timeout: int = 60, broad_search: bool = False) -> dict:
@@ -218,120 +544,140 @@ def query_overpass_with_chunking(search_term: str, bbox: str, place_types: Optio
     
     area = calculate_bbox_area(bbox)
     print_info(f"Bounding box area: {Fore.YELLOW}{area:.2f}{Style.RESET_ALL} square degrees")
-    
+
+    # Build the name pattern and type filters once - only the bbox changes per tile
+    type_filters = build_type_filters(place_types)
+    if broad_search:
+        filters = ('"name"', type_filters)
+    else:
+        filters = (build_name_pattern(search_term, exact_match), type_filters)
+
     # If area is small enough, use single query
-    if area <= 1.0:
+    if area <= SINGLE_QUERY_MAX_AREA:
         print_info("Area is small enough for single query")
         if broad_search:
-            query = generate_broad_overpass_query(bbox, place_types, timeout)
+            query = generate_broad_overpass_query(bbox, place_types, timeout, prebuilt_filters=filters)
         else:
-            query = generate_overpass_query(search_term, bbox, place_types, exact_match, timeout)
+            query = generate_overpass_query(search_term, bbox, place_types, exact_match, timeout,
+                                            prebuilt_filters=filters)
         return query_overpass(query)
     
-    # Split into smaller tiles
+    # Merged tile results are cached under the whole-bbox query, so repeat runs skip
+    # re-probing the tiling and re-reading every tile
+    merged_cache_key = 'chunked\n' + generate_overpass_query(search_term, bbox, place_types, exact_match,
+                                                            timeout, prebuilt_filters=filters)
+    cached_result = read_cached_response(merged_cache_key)
+    if cached_result is not None:
+        return cached_result
+
+    # Split into smaller tiles, subdividing only where elements are dense
     print_warning(f"Large area detected! Splitting into smaller tiles to avoid timeout...")
-    tiles = split_bbox_into_tiles(bbox)
+    tiles = split_bbox_adaptively(bbox, filters, timeout)
+    if background_cancelled():
+        return None
     print_info(f"Split into {Fore.YELLOW}{len(tiles)}{Style.RESET_ALL} tiles for processing")
     
-    # Execute queries on each tile
-    all_elements = []
-    successful_tiles = 0
-    
-    for i, tile_bbox in enumerate(tiles, 1):
-        print_info(f"Processing tile {Fore.CYAN}{i}/{len(tiles)}{Style.RESET_ALL}...")
-        
+    # Build queries for each tile
+    tile_queries = []
+    for tile_bbox in tiles:
         if broad_search:
-            query = generate_broad_overpass_query(tile_bbox, place_types, timeout)
-        else:
-            query = generate_overpass_query(search_term, tile_bbox, place_types, exact_match, timeout)
-        
-        result = query_overpass(query)
-        
-        if result and 'elements' in result:
-            tile_elements = result['elements']
-            all_elements.extend(tile_elements)
-            successful_tiles += 1
-            print_success(f"Tile {i}: Found {Fore.YELLOW}{len(tile_elements)}{Style.RESET_ALL} elements")
+            tile_queries.append(generate_broad_overpass_query(tile_bbox, place_types, timeout,
+                                                              prebuilt_filters=filters))
         else:
-            print_warning(f"Tile {i}: No data or query failed")
-        
-        # Small delay between requests to be nice to the API
-        time.sleep(0.5)
-    
+            tile_queries.append(generate_overpass_query(search_term, tile_bbox, place_types, exact_match, timeout,
+                                                        prebuilt_filters=filters))
+
+    # Execute tile queries concurrently, bounded by the Overpass slot limit
+    print_info(f"Processing tiles with up to {Fore.CYAN}{OVERPASS_MAX_SLOTS}{Style.RESET_ALL} concurrent queries...")
+    tile_elements_by_index = {}
+    successful_tiles = 0
+
+    with ThreadPoolExecutor(max_workers=TILE_WORKERS) as executor:
+        futures = {submit_with_context(executor, query_overpass, query): i
+                   for i, query in enumerate(tile_queries, 1)}
+
+        for future in as_completed(futures):
+            i = futures[future]
+            result = future.result()
+
+            with PRINT_LOCK:
+                if result and 'elements' in result and overpass_runtime_error(result):
+                    # Cut short by Overpass - keep what arrived, but the tile counts as failed
+                    tile_elements_by_index[i] = result['elements']
+                    print_warning(f"Tile {i}/{len(tiles)}: Incomplete result with {len(result['elements'])} elements")
+                elif result and 'elements' in result:
+                    tile_elements = result['elements']
+                    tile_elements_by_index[i] = tile_elements
+                    successful_tiles += 1
+                    print_success(f"Tile {i}/{len(tiles)}: Found {Fore.YELLOW}{len(tile_elements)}{Style.RESET_ALL} elements")
+                else:
+                    print_warning(f"Tile {i}/{len(tiles)}: No data or query failed")
+
+    # Keep tile order so results are deterministic regardless of completion order
+    all_elements = []
+    for i in sorted(tile_elements_by_index):
+        all_elements.extend(tile_elements_by_index[i])
+
     print_success(f"Completed {Fore.YELLOW}{successful_tiles}/{len(tiles)}{Style.RESET_ALL} tiles successfully")
     
-    # Deduplicate results (same OSM ID)
-    seen_ids = set()
-    unique_elements = []
-    
-    for element in all_elements:
-        element_id = f"{element['type']}{element['id']}"
-        if element_id not in seen_ids:
-            seen_ids.add(element_id)
-            unique_elements.append(element)
+    # Deduplicate results (same OSM type and ID) - tiles return identical copies of
+    # shared elements, and dicts keep first-seen order
+    unique_elements = list({(element['type'], element['id']): element for element in all_elements}.values())
     
     if len(all_elements) != len(unique_elements):
         print_info(f"Removed {Fore.YELLOW}{len(all_elements) - len(unique_elements)}{Style.RESET_ALL} duplicate entries")
     
     # Return in the same format as single query
-    return {
+    result = {
         'elements': unique_elements,
         'generator': 'place_detective_chunked'
     }
 
+    # Only cache complete results - a failed (or cancelled) tile should be retried next run
+    if successful_tiles == len(tiles) and not background_cancelled():
+        write_cached_response(merged_cache_key, result)
+
+    return result
+
 def generate_overpass_query(search_term: str, bbox: str, place_types: Optional[List[str]] = None,
-                           exact_match: bool = False, timeout: int = 60) -> str:
+                           exact_match: bool = False, timeout: int = 60,
+                           prebuilt_filters: Optional[Tuple[str, List[str]]] = None,
+                           output: str = "center") -> str:
     """Generate Overpass API query with optional place type filtering"""
 
-    # Create search pattern
-    if exact_match:
-        pattern = f'"name"="{search_term}"'
-    else:
-        # Case-insensitive regex for variations
-        escaped_term = re.escape(search_term)
-        pattern = f'"name"~".*{escaped_term}.*",i'
-
-    # Base query parts
-    queries = []
-
-    # Add place type filters if specified
-    if place_types:
-        for place_type in place_types:
-            if '=' in place_type:
-                # Handle key=value format (e.g., "amenity=restaurant")
-                key, value = place_type.split('=', 1)
-                type_filter = f'["{key}"="{value}"]'
-            else:
-                # Handle key-only format (e.g., "amenity")
-                type_filter = f'["{place_type}"]'
-
-            queries.extend([
-                f'node[{pattern}]{type_filter}({bbox});',
-                f'way[{pattern}]{type_filter}({bbox});',
-                f'relation[{pattern}]{type_filter}({bbox});'
-            ])
-    else:
-        # No place type filter - search all named elements
-        queries.extend([
-            f'node[{pattern}]({bbox});',
-            f'way[{pattern}]({bbox});',
-            f'relation[{pattern}]({bbox});'
-        ])
+    # Build the name pattern and type filters unless the caller already did (once for all tiles)
+    if prebuilt_filters is None:
+        prebuilt_filters = (build_name_pattern(search_term, exact_match), build_type_filters(place_types))
+    pattern, type_filters = prebuilt_filters
+
+    # Only the bbox differs between tiles, so the rest of the query comes from a cached template
+    template = build_query_template(pattern, tuple(type_filters), timeout, output)
+    return template.format(bbox=bbox)
+
+@functools.lru_cache(maxsize=32)
+def build_query_template(pattern: str, type_filters: Tuple[str, ...], timeout: int = 60,
+                         output: str = "center") -> str:
+    """Build Overpass query text with a {bbox} placeholder"""
+
+    # Escape braces in user-supplied filters so only the bbox placeholder gets formatted
+    pattern = pattern.replace('{', '{{').replace('}', '}}')
+    type_filters = [type_filter.replace('{', '{{').replace('}', '}}') for type_filter in type_filters]
+
+    # Union of one statement per type filter - nwr matches nodes, ways and relations at once
+    statements = '\n'.join(f'  nwr[{pattern}]{type_filter}({{bbox}});' for type_filter in type_filters)
 
     query = f"""
     [out:json][timeout:{timeout}];
     (
-      {chr(10).join('  ' + q for q in queries)}
+      {statements}
     );
-    out center meta;
+    out {output};
     """
 
     return query
 
-def extract_place_info(elements: List[dict]) -> List[dict]:
-    """Extract relevant information from OSM elements"""
-    places = []
-
+def iter_place_info(elements: Iterable[dict]) -> Iterator[Place]:
+    """Yield relevant information from OSM elements, one place at a time"""
     for element in elements:
         if 'tags' in element and 'name' in element['tags']:
             name = element['tags']['name']
@@ -350,148 +696,261 @@ def extract_place_info(elements: List[dict]) -> List[dict]:
             place_subcategory = "unknown"
 
             for key, value in tags.items():
-                if key in ['amenity', 'shop', 'leisure', 'tourism', 'healthcare', 'education']:
+                if key in CATEGORY_KEYS:
                     place_category = key
                     place_subcategory = value
                     break
 
             # Extract additional useful information
             address_parts = []
-            if 'addr:housenumber' in tags:
-                address_parts.append(tags['addr:housenumber'])
-            if 'addr:street' in tags:
-                address_parts.append(tags['addr:street'])
-            if 'addr:district' in tags:
-                address_parts.append(tags['addr:district'])
-            if 'addr:city' in tags:
-                address_parts.append(tags['addr:city'])
+            for key in ADDRESS_KEYS:
+                if key in tags:
+                    address_parts.append(tags[key])
 
             address = ', '.join(address_parts) if address_parts else None
 
-            place_info = {
-                'name': name,
-                'type': element['type'],
-                'id': element['id'],
-                'lat': lat,
-                'lon': lon,
-                'category': place_category,
-                'subcategory': place_subcategory,
-                'address': address,
-                'phone': tags.get('phone', None),
-                'website': tags.get('website', None),
-                'opening_hours': tags.get('opening_hours', None),
-                'brand': tags.get('brand', None),
-                'cuisine': tags.get('cuisine', None),
-                'tags': tags
-            }
-            places.append(place_info)
-
-    return places
-
-def format_place_details(place: dict, index: int = None) -> str:
+            yield Place(
+                name=name,
+                type=element['type'],
+                id=element['id'],
+                lat=lat,
+                lon=lon,
+                category=place_category,
+                subcategory=place_subcategory,
+                address=address,
+                phone=tags.get('phone', None),
+                website=tags.get('website', None),
+                opening_hours=tags.get('opening_hours', None),
+                brand=tags.get('brand', None),
+                cuisine=tags.get('cuisine', None)
+            )
+
+def extract_place_info(elements: List[dict]) -> List[Place]:
+    """Extract relevant information from OSM elements"""
+    return list(iter_place_info(elements))
+
+# Place detail templates, rendered with a place's fields. Colors are resolved once here
+# rather than per place; optional lines are only shown when their field has a value.
+PLACE_SUMMARY_TEMPLATE = (
+    f"    {Fore.BLUE}🔍 Type:{Style.RESET_ALL} {{type}} | {Fore.BLUE}Category:{Style.RESET_ALL} {Fore.YELLOW}{{category}}/{{subcategory}}{Style.RESET_ALL}\n"
+    f"    {Fore.BLUE}🆔 OSM ID:{Style.RESET_ALL} {{id}}\n"
+    f"    {Fore.GREEN}📍 Location:{Style.RESET_ALL} {Fore.MAGENTA}{{lat}}, {{lon}}{Style.RESET_ALL}"
+)
+PLACE_ADDRESS_TEMPLATE = f"    {Fore.BLUE}🏠 Address:{Style.RESET_ALL} {{address}}"
+PLACE_BRAND_TEMPLATE = f"    {Fore.BLUE}🏷️  Brand:{Style.RESET_ALL} {Fore.YELLOW}{{brand}}{Style.RESET_ALL}"
+PLACE_DETAIL_TEMPLATES = (
+    ('address', PLACE_ADDRESS_TEMPLATE),
+    ('phone', f"    {Fore.BLUE}📞 Phone:{Style.RESET_ALL} {{phone}}"),
+    ('website', f"    {Fore.BLUE}🌐 Website:{Style.RESET_ALL} {Fore.CYAN}{{website}}{Style.RESET_ALL}"),
+    ('opening_hours', f"    {Fore.BLUE}🕐 Hours:{Style.RESET_ALL} {{opening_hours}}"),
+    ('brand', PLACE_BRAND_TEMPLATE),
+    ('cuisine', f"    {Fore.BLUE}🍽️  Cuisine:{Style.RESET_ALL} {{cuisine}}"),
+)
+MAPS_URL_TEMPLATE = "https://www.google.com/maps?q={lat},{lon}"
+PLACE_MAPS_TEMPLATE = f"    {Fore.GREEN}🗺️  Maps:{Style.RESET_ALL} {UNDERLINE}{Fore.CYAN}{MAPS_URL_TEMPLATE}{Style.RESET_ALL}"
+PLACE_TITLE_TEMPLATE = f"{Fore.CYAN}{Style.BRIGHT}🏢 {{title}}{Style.RESET_ALL}"
+
+def format_place_details(place: Place, index: int = None) -> str:
     """Format place details for detective case file display with colors"""
-    details = []
+    fields = place._asdict()
 
     # Place name with index
-    if index is not None:
-        details.append(f"{Fore.CYAN}{Style.BRIGHT}🏢 [{index}] {place['name']}{Style.RESET_ALL}")
-    else:
-        details.append(f"{Fore.CYAN}{Style.BRIGHT}🏢 {place['name']}{Style.RESET_ALL}")
-
-    # Basic case info with colors
-    details.append(f"    {Fore.BLUE}🔍 Type:{Style.RESET_ALL} {place['type']} | {Fore.BLUE}Category:{Style.RESET_ALL} {Fore.YELLOW}{place['category']}/{place['subcategory']}{Style.RESET_ALL}")
-    details.append(f"    {Fore.BLUE}🆔 OSM ID:{Style.RESET_ALL} {place['id']}")
-    details.append(f"    {Fore.GREEN}📍 Location:{Style.RESET_ALL} {Fore.MAGENTA}{place['lat']}, {place['lon']}{Style.RESET_ALL}")
-
-    # Additional evidence if available with colors and emojis
-    if place['address']:
-        details.append(f"    {Fore.BLUE}🏠 Address:{Style.RESET_ALL} {place['address']}")
-    if place['phone']:
-        details.append(f"    {Fore.BLUE}📞 Phone:{Style.RESET_ALL} {place['phone']}")
-    if place['website']:
-        details.append(f"    {Fore.BLUE}🌐 Website:{Style.RESET_ALL} {Fore.CYAN}{place['website']}{Style.RESET_ALL}")
-    if place['opening_hours']:
-        details.append(f"    {Fore.BLUE}🕐 Hours:{Style.RESET_ALL} {place['opening_hours']}")
-    if place['brand']:
-        details.append(f"    {Fore.BLUE}🏷️  Brand:{Style.RESET_ALL} {Fore.YELLOW}{place['brand']}{Style.RESET_ALL}")
-    if place['cuisine']:
-        details.append(f"    {Fore.BLUE}🍽️  Cuisine:{Style.RESET_ALL} {place['cuisine']}")
-
-    # Investigation link with special formatting
-    if place['lat'] and place['lon']:
-        details.append(f"    {Fore.GREEN}🗺️  Maps:{Style.RESET_ALL} {Fore.UNDERLINE}{Fore.CYAN}https://www.google.com/maps?q={place['lat']},{place['lon']}{Style.RESET_ALL}")
+    title = place.name if index is None else f"[{index}] {place.name}"
+    details = [PLACE_TITLE_TEMPLATE.format(title=title), PLACE_SUMMARY_TEMPLATE.format_map(fields)]
 
-    return '\n'.join(details)
-
-def find_similar_names(target_name: str, all_names: List[str], threshold: int = 80) -> List[Tuple[str, int]]:
-    """Find names similar to target using improved fuzzy matching"""
-    similar_names = []
-    target_lower = target_name.lower()
-    min_length = max(3, len(target_name) // 3)  # Minimum length is 3 or 1/3 of target length
+    # Additional evidence if available
+    for field, template in PLACE_DETAIL_TEMPLATES:
+        if fields[field]:
+            details.append(template.format_map(fields))
 
-    for name in all_names:
-        # Skip very short names that could cause false positives
-        if len(name) < min_length:
-            continue
+    # Investigation link
+    if place.lat and place.lon:
+        details.append(PLACE_MAPS_TEMPLATE.format_map(fields))
 
-        name_lower = name.lower()
-
-        # Skip if the name is too different in length
-        if abs(len(name_lower) - len(target_lower)) > len(target_lower):
-            continue
-
-        # Use multiple similarity algorithms and take the best score
-        ratio_score = fuzz.ratio(target_lower, name_lower)
-        token_sort_score = fuzz.token_sort_ratio(target_lower, name_lower)
-        token_set_score = fuzz.token_set_ratio(target_lower, name_lower)
+    return '\n'.join(details)
 
-        # Take the maximum score from different algorithms
-        similarity = max(ratio_score, token_sort_score, token_set_score)
+def print_place_list(places: List[Place], index_prefix: str = "") -> None:
+    """Print numbered place details separated by blank lines with a single write"""
+    sys.stdout.write('\n\n'.join(format_place_details(place, f"{index_prefix}{i}")
+                                  for i, place in enumerate(places, 1)) + '\n')
+
+def name_forms(name: str) -> Tuple[str, str, str, str]:
+    """Return (name, lowercased, processed, token-sorted processed) forms used for fuzzy scoring"""
+    processed = utils.default_process(name)
+    return (name, name.lower(), processed, ' '.join(sorted(processed.split())))
+
+class NameIndex(NamedTuple):
+    """Distinct names sorted by length, with each name_forms() form as a parallel column"""
+    lengths: np.ndarray
+    forms: Tuple[List[str], ...]
+
+def index_names_by_length(names: List[str]) -> NameIndex:
+    """Build a columnar name index so a length range is a contiguous slice of every column"""
+    # Stable sort keeps the original order among names of equal length
+    names = sorted(names, key=len)
+    lengths = np.fromiter(map(len, names), dtype=np.int64, count=len(names))
+    forms = tuple(map(list, zip(*map(name_forms, names)))) or ([], [], [], [])
+    return NameIndex(lengths, forms)
+
+def find_similar_names(target_name: str, all_names: List[str], threshold: int = 80,
+                       names_by_length: Optional[NameIndex] = None,
+                       limit: Optional[int] = None) -> List[Tuple[str, int]]:
+    """Find names similar to target using improved fuzzy matching, best matches first"""
+    target_forms = name_forms(target_name)
+    min_length = max(3, len(target_name) // 3)  # Minimum length is 3 or 1/3 of target length
 
-        # Only include if similarity is above threshold
-        if similarity >= threshold:
-            similar_names.append((name, similarity))
+    # Reuse the caller's length index (and its cached name forms) when available
+    if names_by_length is None:
+        names_by_length = index_names_by_length(all_names)
+
+    # Only visit lengths that can match: skip very short names that could cause false
+    # positives, and names too different in length. token_set_ratio scores subsets
+    # as 100 regardless of length, so the window cannot be tightened further; the ratio
+    # scorers reject length mismatches themselves once a score_cutoff is given.
+    start, end = np.searchsorted(names_by_length.lengths, [min_length, 2 * len(target_name) + 1]).tolist()
+    if start >= end:
+        return []
+    candidate_forms = [column[start:end] for column in names_by_length.forms]
+    candidate_names = candidate_forms[0]
+
+    # Use multiple similarity algorithms and take the best score. Scores are rounded,
+    # so anything that rounds up to the threshold must survive the cutoff.
+    score_cutoff = max(threshold - 0.5, 0)
+    scores = np.zeros(end - start, dtype=np.uint8)
+    for scorer, form in SIMILARITY_SCORERS:
+        scorer_scores = score_matrix([target_forms[form]], candidate_forms[form], scorer=scorer,
+                                     score_cutoff=score_cutoff)[0]
+        np.maximum(scores, scorer_scores, out=scores)
+
+    # Only include if similarity is above threshold, best first (ties keep candidate order)
+    matches = np.flatnonzero(scores >= threshold)
+    matches = matches[np.argsort(-scores[matches].astype(np.int16), kind='stable')][:limit]
+
+    return [(candidate_names[i], int(scores[i])) for i in matches.tolist()]
+
+def name_shingles(name: str, k: int = 3) -> set:
+    """Get the set of lowercased character k-grams of a name"""
+    text = name.lower()
+    if len(text) <= k:
+        return {text}
+    return {text[i:i + k] for i in range(len(text) - k + 1)}
+
+def find_variation_candidates(names: List[str]) -> List[Tuple[int, int]]:
+    """Find candidate index pairs of similar names using MinHash-LSH"""
+    lsh = MinHashLSH(threshold=LSH_JACCARD_THRESHOLD, num_perm=LSH_NUM_PERM)
+
+    # Build every name's trigram signature once, in bulk
+    shingle_sets = [[shingle.encode('utf-8') for shingle in name_shingles(name)] for name in names]
+    signatures = MinHash.bulk(shingle_sets, num_perm=LSH_NUM_PERM)
+
+    with lsh.insertion_session() as session:
+        for i, minhash in enumerate(signatures):
+            session.insert(i, minhash)
+
+    # Query each name and keep every candidate pair once (i < j)
+    candidates = set()
+    for i, minhash in enumerate(signatures):
+        for j in lsh.query(minhash):
+            if i < j:
+                candidates.add((i, j))
+
+    return sorted(candidates)
+
+def find_similar_pairs(names: List[str], threshold: int, block_size: int = 1000) -> List[Tuple[int, int, int]]:
+    """Find all index pairs (i < j) of names whose ratio similarity is above threshold"""
+    pairs = []
+
+    # Scores are rounded, so only raw scores of at least threshold + 0.5 can end up above
+    # the threshold - a tighter cutoff lets rapidfuzz abandon more pairs early
+    score_cutoff = threshold + 0.5
+
+    # ratio <= 100 * (1 - |a - b| / (a + b)), so a name can only match names up to
+    # (200 - cutoff) / cutoff times its length. With names sorted by length, every
+    # possible partner of a block lies in one contiguous slice after it.
+    order = sorted(range(len(names)), key=lambda i: len(names[i]))
+    sorted_names = [names[i] for i in order]
+    lengths = np.fromiter(map(len, sorted_names), dtype=np.int64, count=len(sorted_names))
+    max_length_ratio = (200 - score_cutoff) / score_cutoff
+
+    # Score in row blocks so the similarity matrix stays bounded for large name sets. Each
+    # block is only compared with the names after its first row, so the lower triangle is
+    # never scored; within the block, column j is sorted name start + 1 + j.
+    for start in range(0, len(sorted_names), block_size):
+        end = min(start + block_size, len(sorted_names))
+        stop = int(np.searchsorted(lengths, lengths[end - 1] * max_length_ratio + 1e-9, side='right'))
+        block = score_matrix(sorted_names[start:end], sorted_names[start + 1:stop], scorer=fuzz.ratio,
+                             score_cutoff=score_cutoff)
+        rows, cols = np.nonzero(np.triu(block > threshold))
+        for i, j in zip(rows.tolist(), cols.tolist()):
+            first, second = order[start + i], order[start + 1 + j]
+            pairs.append((min(first, second), max(first, second), int(block[i, j])))
+
+    # Report pairs in original name order
+    pairs.sort()
+    return pairs
+
+def analyze_findings(places: List[Place]) -> dict:
+    """Analyze the investigation findings"""
 
-    return sorted(similar_names, key=lambda x: x[1], reverse=True)
+    # Group by exact name in a single pass
+    name_groups = defaultdict(list)
+    for place in places:
+        name_groups[place.name].append(place)
 
-def analyze_findings(places: List[dict]) -> dict:
-    """Analyze the investigation findings"""
     analysis = {
         'total_places': len(places),
-        'unique_names': len(set(place['name'] for place in places)),
-        'multiple_locations': {},
+        'unique_names': len(name_groups),
+        'multiple_locations': {name: group for name, group in name_groups.items() if len(group) > 1},
         'name_variations': []
     }
 
-    # Group by exact name
-    name_groups = {}
-    for place in places:
-        name = place['name']
-        if name not in name_groups:
-            name_groups[name] = []
-        name_groups[name].append(place)
-
-    # Find names with multiple locations
-    for name, group in name_groups.items():
-        if len(group) > 1:
-            analysis['multiple_locations'][name] = group
-
     # Find name variations using fuzzy matching
     names = list(name_groups.keys())
-    for i, name1 in enumerate(names):
-        for name2 in names[i+1:]:
-            similarity = fuzz.ratio(name1.lower(), name2.lower())
-            if similarity > 80:  # High similarity threshold
-                analysis['name_variations'].append({
-                    'name1': name1,
-                    'name2': name2,
-                    'similarity': similarity,
-                    'places1': name_groups[name1],
-                    'places2': name_groups[name2]
-                })
+    names_lower = [name.lower() for name in names]
+    if LSH_AVAILABLE and len(names) > LSH_MIN_NAMES:
+        # Large result set - only verify pairs proposed by MinHash-LSH, scoring
+        # them element-wise in parallel
+        candidates = find_variation_candidates(names)
+        pairs = []
+        if candidates:
+            first, second = zip(*candidates)
+            scores = score_pairwise([names_lower[i] for i in first], [names_lower[j] for j in second],
+                                    scorer=fuzz.ratio, score_cutoff=NAME_VARIATION_THRESHOLD + 0.5)
+            pairs = zip(first, second, scores.tolist())
+    else:
+        pairs = find_similar_pairs(names_lower, NAME_VARIATION_THRESHOLD)
+
+    for i, j, similarity in pairs:
+        name1, name2 = names[i], names[j]
+        if similarity > NAME_VARIATION_THRESHOLD:  # High similarity threshold
+            analysis['name_variations'].append({
+                'name1': name1,
+                'name2': name2,
+                'similarity': similarity,
+                'places1': name_groups[name1],
+                'places2': name_groups[name2]
+            })
 
     return analysis
 
+def write_json_report(filename: str, places: List[Place]) -> None:
+    """Write places as indented UTF-8 JSON objects, using orjson when available"""
+    if ORJSON_AVAILABLE:
+        # orjson converts each place to a dict only as it is serialized
+        with open(filename, 'wb') as f:
+            f.write(orjson.dumps(places, default=Place._asdict, option=orjson.OPT_INDENT_2))
+    else:
+        # The json module writes tuples as arrays, so convert places to dicts up front
+        with open(filename, 'w', encoding='utf-8') as f:
+            json.dump([place._asdict() for place in places], f, indent=2, ensure_ascii=False)
+
+def write_csv_report(filename: str, places: List[Place]) -> None:
+    """Stream places to a CSV file with the report columns"""
+    with open(filename, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f, lineterminator='\n')
+        writer.writerow(EXPORT_COLUMNS)
+        writer.writerows(places)
+
 def parse_arguments():
     """Parse command line arguments"""
     parser = argparse.ArgumentParser(
@@ -553,6 +1012,8 @@ def parse_arguments():
                        help='Use exact name matching instead of partial matching')
     parser.add_argument('--no-fuzzy', action='store_true',
                        help='Disable fuzzy matching')
+    parser.add_argument('--fuzzy-only-if-empty', action='store_true',
+                       help='Only run fuzzy matching when the search finds no places')
     parser.add_argument('--fuzzy-threshold', type=int, default=85,
                        help='Fuzzy matching threshold (default: 85)')
     parser.add_argument('--timeout', type=int, default=60,
@@ -561,6 +1022,14 @@ def parse_arguments():
                        help='Output format (default: table)')
     parser.add_argument('-o', '--output-file',
                        help='Output file path (optional, defaults to auto-generated filename)')
+    parser.add_argument('-q', '--quiet', action='store_true',
+                       help='Skip per-place details on screen - show counts and summaries only')
+    parser.add_argument('--cache-dir', default=CACHE_SETTINGS['dir'],
+                       help=f"Directory for cached Overpass responses (default: {CACHE_SETTINGS['dir']})")
+    parser.add_argument('--cache-ttl', type=float, default=CACHE_SETTINGS['ttl_hours'],
+                       help=f"Hours before cached Overpass responses expire (default: {CACHE_SETTINGS['ttl_hours']:g})")
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Disable the Overpass response cache')
 
     return parser.parse_args()
 
@@ -579,6 +1048,12 @@ def main():
     if not install_packages():
         return
 
+    # Configure the Overpass response cache
+    CACHE_SETTINGS['enabled'] = not args.no_cache
+    CACHE_SETTINGS['dir'] = args.cache_dir
+    CACHE_SETTINGS['ttl_hours'] = args.cache_ttl
+    prune_expired_cache()
+
     # Get configuration
     # Select bounding box based on area scope
     if args.area_scope == 'province':
@@ -597,7 +1072,28 @@ def main():
     print(f"  {Fore.BLUE}🌍 Area:{Style.RESET_ALL} {Fore.CYAN}{args.city.title()}{Style.RESET_ALL} ({Fore.MAGENTA}{scope_description}{Style.RESET_ALL})")
     print(f"  {Fore.BLUE}🏷️  Place types:{Style.RESET_ALL} {Fore.GREEN}{place_types if place_types else 'All types'}{Style.RESET_ALL}")
     print(f"  {Fore.BLUE}🎯 Exact match:{Style.RESET_ALL} {Fore.YELLOW}{args.exact}{Style.RESET_ALL}")
-    print(f"  {Fore.BLUE}🔄 Fuzzy matching:{Style.RESET_ALL} {Fore.YELLOW}{not args.no_fuzzy}{Style.RESET_ALL}")
+    print(f"  {Fore.BLUE}🔄 Fuzzy matching:{Style.RESET_ALL} {Fore.YELLOW}{'Only if no places found' if args.fuzzy_only_if_empty and not args.no_fuzzy else not args.no_fuzzy}{Style.RESET_ALL}")
+    print(f"  {Fore.BLUE}💾 Response cache:{Style.RESET_ALL} {Fore.YELLOW}{f'{args.cache_ttl:g}h TTL' if not args.no_cache else 'Disabled'}{Style.RESET_ALL}")
+
+    # Broad search of all named places, used for fuzzy matching
+    broad_search_args = dict(
+        search_term="",  # Not used for broad search
+        bbox=bbox,
+        place_types=place_types,
+        exact_match=False,
+        timeout=args.timeout,
+        broad_search=True
+    )
+
+    # Start the broad fetch right away when fuzzy matching will always run, so its Overpass
+    # round-trip overlaps the exact search - its status lines are replayed in step 3. Only a
+    # single-query broad search is prefetched: chunked tiles would compete with the exact
+    # search for the Overpass slots and delay step 1's results
+    broad_future = None
+    if (not args.no_fuzzy and not args.fuzzy_only_if_empty
+            and calculate_bbox_area(bbox) <= SINGLE_QUERY_MAX_AREA):
+        broad_future, broad_status, broad_cancel = run_in_background(query_overpass_with_chunking,
+                                                                     **broad_search_args)
 
     # Generate and execute query
     print(f"\n{Fore.MAGENTA}{Style.BRIGHT}🔍 STEP 1: Investigating '{Fore.YELLOW}{search_term}{Style.RESET_ALL}{Fore.MAGENTA}{Style.BRIGHT}'...{Style.RESET_ALL}")
@@ -621,11 +1117,9 @@ def main():
             # Handle output format
             if args.output == 'table':
                 # Display to terminal with colors
-                print()
-                for i, place in enumerate(places, 1):
-                    print(format_place_details(place, i))
-                    if i < len(places):
-                        print()
+                if not args.quiet:
+                    print()
+                    print_place_list(places)
 
             elif args.output == 'json':
                 # Generate filename if not provided
@@ -636,15 +1130,8 @@ def main():
                     safe_search_term = re.sub(r'[^\w\-_]', '_', search_term)
                     filename = f"place_detective_{safe_search_term}_{args.city}_{timestamp}.json"
 
-                # Remove internal tags for cleaner JSON output
-                clean_places = []
-                for place in places:
-                    clean_place = {k: v for k, v in place.items() if k != 'tags'}
-                    clean_places.append(clean_place)
-
                 # Write to file
-                with open(filename, 'w', encoding='utf-8') as f:
-                    json.dump(clean_places, f, indent=2, ensure_ascii=False)
+                write_json_report(filename, places)
 
                 print_file(f"JSON report saved to: {Fore.CYAN}{filename}{Style.RESET_ALL}")
 
@@ -657,14 +1144,8 @@ def main():
                     safe_search_term = re.sub(r'[^\w\-_]', '_', search_term)
                     filename = f"place_detective_{safe_search_term}_{args.city}_{timestamp}.csv"
 
-                # Prepare CSV data
-                df = pd.DataFrame(places)
-                display_columns = ['name', 'type', 'id', 'lat', 'lon', 'category', 'subcategory',
-                                 'address', 'phone', 'website', 'opening_hours', 'brand', 'cuisine']
-                available_columns = [col for col in display_columns if col in df.columns]
-
-                # Write to file
-                df[available_columns].to_csv(filename, index=False)
+                # Write to file row by row
+                write_csv_report(filename, places)
                 print_file(f"CSV report saved to: {Fore.CYAN}{filename}{Style.RESET_ALL}")
         else:
             print_warning("No places found with specified criteria")
@@ -672,6 +1153,13 @@ def main():
         print_error("Query failed")
         places = []
 
+    # Fuzzy matching expands on the places found by default, or with --fuzzy-only-if-empty
+    # only stands in for a search that found none
+    fuzzy_wanted = not args.no_fuzzy and (not places if args.fuzzy_only_if_empty else bool(places))
+    if broad_future is not None and not fuzzy_wanted:
+        # Step 3 will not run - stop the background broad search from sending more queries
+        broad_cancel.set()
+
     # Analyze findings if we found places
     if places:
         print(f"\n{Fore.MAGENTA}{Style.BRIGHT}🕵️ STEP 2: Analyzing investigation findings...{Style.RESET_ALL}")
@@ -684,11 +1172,9 @@ def main():
             print(f"\n{Fore.CYAN}{Style.BRIGHT}📍 MULTIPLE LOCATIONS DISCOVERED{Style.RESET_ALL}")
             for name, locations in analysis['multiple_locations'].items():
                 print(f"\n{Fore.YELLOW}{Style.BRIGHT}🏢 '{name}' found at {len(locations)} locations:{Style.RESET_ALL}")
-                print(f"{Fore.CYAN}{'-' * 50}{Style.RESET_ALL}")
-                for i, place in enumerate(locations, 1):
-                    print(format_place_details(place, i))
-                    if i < len(locations):
-                        print()
+                if not args.quiet:
+                    print(f"{Fore.CYAN}{'-' * 50}{Style.RESET_ALL}")
+                    print_place_list(locations)
         else:
             print_success("Each place name found at single location")
 
@@ -696,68 +1182,53 @@ def main():
             print(f"\n{Fore.YELLOW}{Style.BRIGHT}🔍 SIMILAR NAME VARIATIONS DISCOVERED{Style.RESET_ALL}")
             for variation in analysis['name_variations']:
                 print(f"\n{Fore.MAGENTA}🔍 '{variation['name1']}' vs '{variation['name2']}' (similarity: {Fore.YELLOW}{variation['similarity']}%{Fore.MAGENTA}){Style.RESET_ALL}")
+                if args.quiet:
+                    continue
                 print(f"{Fore.CYAN}{'-' * 60}{Style.RESET_ALL}")
                 print(f"{Fore.BLUE}{Style.BRIGHT}First variation:{Style.RESET_ALL}")
-                for i, place in enumerate(variation['places1'], 1):
-                    print(format_place_details(place, f"A{i}"))
-                    if i < len(variation['places1']):
-                        print()
+                print_place_list(variation['places1'], "A")
                 print(f"\n{Fore.BLUE}{Style.BRIGHT}Second variation:{Style.RESET_ALL}")
-                for i, place in enumerate(variation['places2'], 1):
-                    print(format_place_details(place, f"B{i}"))
-                    if i < len(variation['places2']):
-                        print()
+                print_place_list(variation['places2'], "B")
         else:
             print_info("No similar name variations found")
 
+    # Number of similar places step 3 found (None if it did not run or its fetch failed)
+    similar_found = None
+
     # Optional fuzzy matching for broader search
-    if not args.no_fuzzy and places:
+    if fuzzy_wanted:
         print(f"\n{Fore.MAGENTA}{Style.BRIGHT}🔍 STEP 3: Expanding search with fuzzy matching...{Style.RESET_ALL}")
 
         # Get all places in the area for comparison
         print_info("Gathering all places from the area (this may take a while)...")
 
-        # Create a broader query to get all named places
-        if place_types:
-            type_filters = []
-            for place_type in place_types:
-                if '=' in place_type:
-                    key, value = place_type.split('=', 1)
-                    type_filters.append(f'["{key}"="{value}"]')
-                else:
-                    type_filters.append(f'["{place_type}"]')
-
-            queries = []
-            for type_filter in type_filters:
-                queries.extend([
-                    f'node["name"]{type_filter}({bbox});',
-                    f'way["name"]{type_filter}({bbox});',
-                    f'relation["name"]{type_filter}({bbox});'
-                ])
-        else:
-            queries = [
-                f'node["name"]({bbox});',
-                f'way["name"]({bbox});',
-                f'relation["name"]({bbox});'
-            ]
-
         print_info("Using chunking system for fuzzy matching broad search...")
-        
-        # Use chunking for fuzzy matching broad search
-        broad_result = query_overpass_with_chunking(
-            search_term="",  # Not used for broad search
-            bbox=bbox,
-            place_types=place_types,
-            exact_match=False,
-            timeout=args.timeout,
-            broad_search=True
-        )
 
-        if broad_result:
-            all_places = extract_place_info(broad_result['elements'])
-            all_names = [place['name'] for place in all_places]
+        if broad_future is not None:
+            # Wait for the broad search started alongside step 1
+            broad_result = broad_future.result()
+            for line in broad_status:
+                print(line)
+        else:
+            broad_result = query_overpass_with_chunking(**broad_search_args)
 
-            similar_names = find_similar_names(search_term, all_names, threshold=args.fuzzy_threshold)
+        if broad_result:
+            # Map each distinct name to its first place - chains repeat the same name many
+            # times, so names are scored once and matches resolve with a dict lookup.
+            # Elements with an already seen name are skipped before building a place.
+            first_element_by_name = {}
+            for element in broad_result['elements']:
+                name = element.get('tags', {}).get('name')
+                if name is not None:
+                    first_element_by_name.setdefault(name, element)
+            first_place_by_name = {place.name: place
+                                   for place in iter_place_info(first_element_by_name.values())}
+            all_names = list(first_place_by_name)
+            names_by_length = index_names_by_length(all_names)
+
+            similar_names = find_similar_names(search_term, all_names, threshold=args.fuzzy_threshold,
+                                               names_by_length=names_by_length, limit=10)
+            similar_found = len(similar_names)
 
             if similar_names:
                 print(f"\n{Fore.CYAN}{Style.BRIGHT}🔍 ADDITIONAL FINDINGS - Similar Places to '{Fore.YELLOW}{search_term}{Style.RESET_ALL}{Fore.CYAN}{Style.BRIGHT}':{Style.RESET_ALL}")
@@ -765,25 +1236,26 @@ def main():
 
                 # Get detailed info for fuzzy matches
                 fuzzy_places = []
-                for name, score in similar_names[:10]:  # Show top 10 matches
-                    matching_places = [p for p in all_places if p['name'] == name]
-                    if matching_places:
-                        fuzzy_places.append((matching_places[0], score))
+                for name, score in similar_names:  # Top 10 matches
+                    fuzzy_places.append((first_place_by_name[name], score))
 
-                print()
+                # Render all matches into one buffer and write it at once
+                output = ['']
                 for i, (place, score) in enumerate(fuzzy_places, 1):
-                    print(f"{Fore.CYAN}{Style.BRIGHT}🏢 [{i}] {place['name']} (similarity: {Fore.YELLOW}{score}%{Fore.CYAN}){Style.RESET_ALL}")
-                    print(f"    {Fore.BLUE}🔍 Type:{Style.RESET_ALL} {place['type']} | {Fore.BLUE}Category:{Style.RESET_ALL} {Fore.YELLOW}{place['category']}/{place['subcategory']}{Style.RESET_ALL}")
-                    print(f"    {Fore.BLUE}🆔 OSM ID:{Style.RESET_ALL} {place['id']}")
-                    print(f"    {Fore.GREEN}📍 Location:{Style.RESET_ALL} {Fore.MAGENTA}{place['lat']}, {place['lon']}{Style.RESET_ALL}")
-                    if place['address']:
-                        print(f"    {Fore.BLUE}🏠 Address:{Style.RESET_ALL} {place['address']}")
-                    if place['brand']:
-                        print(f"    {Fore.BLUE}🏷️  Brand:{Style.RESET_ALL} {Fore.YELLOW}{place['brand']}{Style.RESET_ALL}")
-                    if place['lat'] and place['lon']:
-                        print(f"    {Fore.GREEN}🗺️  Maps:{Style.RESET_ALL} {Fore.UNDERLINE}{Fore.CYAN}https://www.google.com/maps?q={place['lat']},{place['lon']}{Style.RESET_ALL}")
+                    output.append(f"{Fore.CYAN}{Style.BRIGHT}🏢 [{i}] {place.name} (similarity: {Fore.YELLOW}{score}%{Fore.CYAN}){Style.RESET_ALL}")
+                    if args.quiet:
+                        continue
+                    fields = place._asdict()
+                    output.append(PLACE_SUMMARY_TEMPLATE.format_map(fields))
+                    if place.address:
+                        output.append(PLACE_ADDRESS_TEMPLATE.format_map(fields))
+                    if place.brand:
+                        output.append(PLACE_BRAND_TEMPLATE.format_map(fields))
+                    if place.lat and place.lon:
+                        output.append(PLACE_MAPS_TEMPLATE.format_map(fields))
                     if i < len(fuzzy_places):
-                        print()
+                        output.append('')
+                sys.stdout.write('\n'.join(output) + '\n')
             else:
                 print_info(f"No similar places found for '{search_term}'")
         else:
@@ -820,6 +1292,17 @@ def main():
                 print(f"  {Fore.GREEN}✅ Each place has a unique name and location{Style.RESET_ALL}")
             else:
                 print(f"  {Fore.YELLOW}⚠️  No places found matching '{search_term}'{Style.RESET_ALL}")
+    elif result:
+        # The search itself succeeded but found no places
+        print(f"\n{Fore.YELLOW}{Style.BRIGHT}⚠️  NO EXACT MATCHES{Style.RESET_ALL}")
+        print(f"  {Fore.BLUE}🔍 Investigation results for '{Fore.YELLOW}{search_term}{Style.RESET_ALL}{Fore.BLUE}':{Style.RESET_ALL}")
+        print(f"  {Fore.YELLOW}⚠️  No places found matching '{search_term}'{Style.RESET_ALL}")
+        if similar_found:
+            print(f"  {Fore.GREEN}✅ Found {Fore.YELLOW}{similar_found}{Style.RESET_ALL}{Fore.GREEN} similar place(s) - see the additional findings above{Style.RESET_ALL}")
+        elif similar_found == 0:
+            print(f"  {Fore.YELLOW}⚠️  No similar places found either{Style.RESET_ALL}")
+        elif fuzzy_wanted:
+            print(f"  {Fore.RED}❌ Could not fetch the area's places for fuzzy matching - try running again{Style.RESET_ALL}")
     else:
         print(f"\n{Fore.RED}{Style.BRIGHT}❌ INVESTIGATION INCOMPLETE{Style.RESET_ALL}")
         print(f"  {Fore.RED}Unable to complete the investigation due to data retrieval issues{Style.RESET_ALL}")